@@ -20,7 +20,145 @@ Author: ChatGPT (example)
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, font
+import bisect
 import os
+import re
+
+class _UndoManager:
+    """Python-side undo/redo for a Text widget.
+
+    Tk's built-in undo stores the full inserted/deleted string per edit
+    and grows without bound. This manager intercepts the widget's Tcl
+    insert/delete commands, records small (op, index, text) deltas on a
+    capped stack, and absorbs deltas into a full-buffer snapshot
+    whenever the cap forces old ones to be dropped, keeping a few
+    snapshots as a coarse fallback beyond the delta horizon.
+    """
+
+    MAX_OPS = 400       # delta stack cap
+    MAX_SNAPSHOTS = 5   # full-buffer fallback states
+
+    def __init__(self, text):
+        self.text = text
+        self.undo_stack = []
+        self.redo_stack = []
+        self.snapshots = []
+        self.enabled = True
+        self.on_edit = None  # called for every insert/delete, recorded or not
+        # Rename the widget's Tcl command and interpose our own so every
+        # edit (typing, paste, programmatic) passes through _dispatch.
+        self._orig = text._w + '_orig'
+        text.tk.call('rename', text._w, self._orig)
+        text.tk.createcommand(text._w, self._dispatch)
+
+    def _dispatch(self, cmd, *args):
+        if cmd in ('insert', 'delete') and args:
+            if self.enabled:
+                try:
+                    self._record(cmd, args)
+                except tk.TclError:
+                    pass
+            if self.on_edit is not None:
+                self.on_edit()
+        return self.text.tk.call((self._orig, cmd) + args)
+
+    def _get(self, start, end):
+        return str(self.text.tk.call(self._orig, 'get', start, end))
+
+    def _past_end(self, index):
+        return bool(self.text.tk.getboolean(
+            self.text.tk.call(self._orig, 'compare', index, '>', 'end-1c')))
+
+    def _record(self, cmd, args):
+        # Called before the edit is applied, so the widget still holds
+        # the pre-edit state.
+        index = str(self.text.tk.call(self._orig, 'index', args[0]))
+        if cmd == 'insert':
+            chars = ''.join(str(a) for a in args[1::2])  # skip tag lists
+            if not chars:
+                return
+            # Tk clamps inserts at 'end' to just before the phantom
+            # trailing newline; record where the text actually lands or
+            # the inverse delete misses it.
+            if self._past_end(index):
+                index = str(self.text.tk.call(self._orig, 'index', 'end-1c'))
+            self._push(('insert', index, chars))
+        else:
+            end = args[1] if len(args) > 1 else f'{index}+1c'
+            # delete never removes the phantom trailing newline, so keep
+            # it out of the recorded text — otherwise each undo/redo
+            # cycle grows the buffer by a line.
+            if self._past_end(end):
+                end = 'end-1c'
+            deleted = self._get(index, end)
+            if not deleted:
+                return
+            self._push(('delete', index, deleted))
+
+    def _push(self, op):
+        if len(self.undo_stack) >= self.MAX_OPS:
+            # The cap is about to drop old deltas; absorb them into a
+            # snapshot of the pre-edit buffer so coarse undo past this
+            # point still works. Keeps the O(document) copy off the
+            # per-keystroke path.
+            self.snapshots.append(self._get('1.0', 'end-1c'))
+            del self.snapshots[:-self.MAX_SNAPSHOTS]
+            self.undo_stack.clear()
+        self.undo_stack.append(op)
+        self.redo_stack.clear()
+
+    def _apply(self, op, index, chars):
+        self.enabled = False
+        try:
+            if op == 'insert':
+                self.text.insert(index, chars)
+            elif op == 'delete':
+                self.text.delete(index, f'{index}+{len(chars)}c')
+            else:  # 'restore': full-buffer snapshot
+                self.text.delete('1.0', 'end')
+                self.text.insert('1.0', chars)
+            self.text.mark_set('insert', index)
+            self.text.see('insert')
+        finally:
+            self.enabled = True
+
+    def undo(self):
+        if self.undo_stack:
+            op, index, chars = self.undo_stack.pop()
+            if op == 'restore':
+                current = self._get('1.0', 'end-1c')
+                self._apply('restore', '1.0', chars)
+                self.redo_stack.append(('restore', '1.0', current))
+            else:
+                inverse = 'delete' if op == 'insert' else 'insert'
+                self._apply(inverse, index, chars)
+                self.redo_stack.append((op, index, chars))
+        elif self.snapshots:
+            current = self._get('1.0', 'end-1c')
+            snap = self.snapshots.pop()
+            if snap == current and self.snapshots:
+                snap = self.snapshots.pop()
+            self._apply('restore', '1.0', snap)
+            self.redo_stack.append(('restore', '1.0', current))
+
+    def redo(self):
+        if not self.redo_stack:
+            return
+        op, index, chars = self.redo_stack.pop()
+        if op == 'restore':
+            current = self._get('1.0', 'end-1c')
+            self._apply('restore', '1.0', chars)
+            self.undo_stack.append(('restore', '1.0', current))
+        else:
+            self._apply(op, index, chars)
+            self.undo_stack.append((op, index, chars))
+
+    def reset(self):
+        # Forget all history, e.g. after loading a file.
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.snapshots.clear()
+
 
 class Notepad:
     def __init__(self, root):
@@ -28,6 +166,16 @@ class Notepad:
         self.root.title('Untitled - Notepad')
         self.root.geometry('900x600')
         self.filename = None
+        self._status_pending = False
+        self._dirty = False
+        self._last_status = None
+        self._pending_refresh = False
+        self._line_count = None
+        self._loading = False
+        self.edit_serial = 0
+        self._find_dlg = None
+        self._replace_dlg = None
+        self._font_dlg = None
         self._set_icons()
 
         # Default font
@@ -37,6 +185,7 @@ class Notepad:
 
         # Create UI
         self._create_widgets()
+        self._update_font_metrics()
         self._create_menu()
         self._bind_shortcuts()
         self._update_title()
@@ -51,7 +200,9 @@ class Notepad:
 
     def _create_widgets(self):
         # Main text area with scrollbar
-        self.text = tk.Text(self.root, wrap='none', undo=True, font=self.text_font)
+        self.text = tk.Text(self.root, wrap='none', undo=False, font=self.text_font)
+        self.undo_mgr = _UndoManager(self.text)
+        self.undo_mgr.on_edit = self._on_edit
         self.v_scroll = tk.Scrollbar(self.root, orient='vertical', command=self.text.yview)
         self.h_scroll = tk.Scrollbar(self.root, orient='horizontal', command=self.text.xview)
         self.text.configure(yscrollcommand=self.v_scroll.set, xscrollcommand=self.h_scroll.set)
@@ -83,8 +234,8 @@ class Notepad:
 
         # Edit Menu
         edit_menu = tk.Menu(menubar, tearoff=0)
-        edit_menu.add_command(label='Undo', accelerator='Ctrl+Z', command=self.text.edit_undo)
-        edit_menu.add_command(label='Redo', accelerator='Ctrl+Y', command=self.text.edit_redo)
+        edit_menu.add_command(label='Undo', accelerator='Ctrl+Z', command=self.edit_undo)
+        edit_menu.add_command(label='Redo', accelerator='Ctrl+Y', command=self.edit_redo)
         edit_menu.add_separator()
         edit_menu.add_command(label='Cut', accelerator='Ctrl+X', command=lambda: self.text.event_generate('<<Cut>>'))
         edit_menu.add_command(label='Copy', accelerator='Ctrl+C', command=lambda: self.text.event_generate('<<Copy>>'))
@@ -110,45 +261,110 @@ class Notepad:
         self.root.config(menu=menubar)
 
     def _bind_shortcuts(self):
-        self.root.bind('<Control-n>', lambda e: self.new_file())
-        self.root.bind('<Control-o>', lambda e: self.open_file())
-        self.root.bind('<Control-s>', lambda e: self.save_file())
-        self.root.bind('<Control-S>', lambda e: self.save_as())
-        self.root.bind('<Control-f>', lambda e: self.find_text())
-        self.root.bind('<Control-h>', lambda e: self.replace_text())
-        self.root.bind('<Control-g>', lambda e: self.goto_line())
-        self.root.bind('<Key>', lambda e: self._update_status())
+        # Bind accelerators on the text widget rather than the root and
+        # return 'break' so Tk stops walking the widget/class/toplevel/
+        # all binding chain (and skips class defaults like <Control-h>'s
+        # backspace) on every accelerator keystroke.
+        shortcuts = {
+            '<Control-n>': self.new_file,
+            '<Control-o>': self.open_file,
+            '<Control-s>': self.save_file,
+            '<Control-S>': self.save_as,
+            '<Control-f>': self.find_text,
+            '<Control-h>': self.replace_text,
+            '<Control-g>': self.goto_line,
+        }
+        for seq, handler in shortcuts.items():
+            self.text.bind(seq, lambda e, h=handler: (h(), 'break')[1])
+        self.root.bind('<Key>', lambda e: self._schedule_status())
+        # With undo=False the Text class bindings for <<Undo>>/<<Redo>>
+        # are inert; route them to the Python-side manager.
+        self.text.bind('<<Undo>>', lambda e: (self.edit_undo(), 'break')[1])
+        self.text.bind('<<Redo>>', lambda e: (self.edit_redo(), 'break')[1])
+        self.root.bind('<Map>', self._on_map)
 
     # File operations
     def new_file(self):
+        if self._loading:
+            return
         if self._maybe_save():
             self.text.delete('1.0', tk.END)
+            self.undo_mgr.reset()
             self.filename = None
+            self._mark_clean()
             self._update_title()
 
     def open_file(self):
+        if self._loading:
+            return
         if not self._maybe_save():
             return
         file = filedialog.askopenfilename(defaultextension='.txt', filetypes=[('Text Documents', '*.txt'), ('All Files', '*.*')])
         if file:
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = f.read()
-                self.text.delete('1.0', tk.END)
-                self.text.insert('1.0', data)
-                self.filename = file
-                self._update_title()
-                self.text.edit_modified(False)
+                # Binary read plus one explicit decode skips the
+                # TextIOWrapper layer and its incremental newline
+                # translation; normalize CRLF in a single pass instead.
+                with open(file, 'rb') as f:
+                    raw = f.read()
+                data = raw.decode('utf-8').replace('\r\n', '\n')
             except Exception as e:
                 messagebox.showerror('Open File', f'Failed to open file: {e}')
+                return
+            # Block save/open/new/undo until the idle loader finishes;
+            # a mid-load Ctrl+S would otherwise write the half-loaded
+            # buffer back over the file being opened.
+            self._loading = True
+            # The load's delete+inserts would otherwise fire <<Modified>>
+            # (and status refreshes) for no user-visible reason; drop the
+            # binding until the load completes. Undo recording is already
+            # paused via the manager's enabled flag.
+            self.text.unbind('<<Modified>>')
+            self.undo_mgr.enabled = False
+            self.text.delete('1.0', tk.END)
+            self.filename = file
+            self._start_load(data)
+
+    def _start_load(self, data):
+        # Feed the widget 64 KB per after_idle slice so multi-megabyte
+        # files load without freezing the event loop; the widget is kept
+        # disabled (and progress shown in the status bar) until done.
+        self.text.config(state='disabled')
+        # Loading is not an edit; don't record it in undo history.
+        self.undo_mgr.enabled = False
+        pos = 0
+
+        def step():
+            nonlocal pos
+            if pos < len(data):
+                chunk = data[pos:pos + 65536]
+                pos += len(chunk)
+                self.text.config(state='normal')
+                self.text.insert(tk.END, chunk)
+                self.text.config(state='disabled')
+                self.status.set(f'Loading... {pos:,} chars')
+                self.root.after_idle(step)
+            else:
+                self.text.config(state='normal')
+                self.undo_mgr.enabled = True
+                self.undo_mgr.reset()
+                self._loading = False
+                self._mark_clean()
+                self.text.bind('<<Modified>>', self._on_modified)
+                self._update_title()
+                self._last_status = None
+                self._update_status()
+
+        self.root.after_idle(step)
 
     def save_file(self):
+        if self._loading:
+            return False
         if self.filename:
             try:
-                data = self.text.get('1.0', tk.END)
-                with open(self.filename, 'w', encoding='utf-8') as f:
-                    f.write(data.rstrip('\n'))
-                self.text.edit_modified(False)
+                with open(self.filename, 'wb', buffering=1 << 17) as f:
+                    self._write_buffer(f)
+                self._mark_clean()
                 self._update_title()
                 return True
             except Exception as e:
@@ -158,14 +374,15 @@ class Notepad:
             return self.save_as()
 
     def save_as(self):
+        if self._loading:
+            return False
         file = filedialog.asksaveasfilename(defaultextension='.txt', filetypes=[('Text Documents', '*.txt'), ('All Files', '*.*')])
         if file:
             try:
-                data = self.text.get('1.0', tk.END)
-                with open(file, 'w', encoding='utf-8') as f:
-                    f.write(data.rstrip('\n'))
+                with open(file, 'wb', buffering=1 << 17) as f:
+                    self._write_buffer(f)
                 self.filename = file
-                self.text.edit_modified(False)
+                self._mark_clean()
                 self._update_title()
                 return True
             except Exception as e:
@@ -173,12 +390,28 @@ class Notepad:
                 return False
         return False
 
+    def _write_buffer(self, f):
+        # Write the widget content in 1024-line windows so saving never
+        # materializes the whole buffer as a single Python string.
+        # Stopping the final window at 'end-1c' excludes the newline Tk
+        # appends internally, so no rstrip pass (and extra copy) is needed.
+        # f is binary; each window is encoded once, with no TextIOWrapper
+        # newline re-translation in between.
+        last_line = int(self.text.index('end-1c').split('.')[0])
+        for start in range(1, last_line + 1, 1024):
+            stop = f'{start + 1024}.0' if start + 1024 <= last_line else 'end-1c'
+            f.write(self.text.get(f'{start}.0', stop).encode('utf-8'))
+
     def exit_app(self):
         if self._maybe_save():
             self.root.destroy()
 
+    def _mark_clean(self):
+        self._dirty = False
+        self.text.edit_modified(False)
+
     def _maybe_save(self):
-        if self.text.edit_modified():
+        if self._dirty:
             choice = messagebox.askyesnocancel('Save', 'You have unsaved changes. Save before continuing?')
             if choice:  # Yes
                 return self.save_file()
@@ -189,17 +422,41 @@ class Notepad:
         return True
 
     # Edit helpers
+    def edit_undo(self):
+        # Replaying stale deltas into a half-loaded buffer would corrupt
+        # it; undo history is reset when the load completes anyway.
+        if not self._loading:
+            self.undo_mgr.undo()
+
+    def edit_redo(self):
+        if not self._loading:
+            self.undo_mgr.redo()
+
+    # Dialogs are built once and then hidden/shown with withdraw()/
+    # deiconify(); rebuilding the Toplevel and its widgets on every
+    # invocation wastes ~20 Tk allocations per open.
     def find_text(self):
-        FindDialog(self.root, self.text)
+        if self._find_dlg is None:
+            self._find_dlg = FindDialog(self.root, self)
+        else:
+            self._find_dlg.deiconify()
+        self._find_dlg.find_entry.focus_set()
 
     def replace_text(self):
-        ReplaceDialog(self.root, self.text)
+        if self._replace_dlg is None:
+            self._replace_dlg = ReplaceDialog(self.root, self)
+        else:
+            self._replace_dlg.deiconify()
+        self._replace_dlg.find_entry.focus_set()
 
     def goto_line(self):
         line = simpledialog.askinteger('Go To Line', 'Enter line number:')
         if line is None:
             return
-        max_line = int(self.text.index('end-1c').split('.')[0])
+        # Cached between edits; _on_edit invalidates it.
+        if self._line_count is None:
+            self._line_count = int(self.text.index('end-1c').split('.')[0])
+        max_line = self._line_count
         if line < 1:
             line = 1
         if line > max_line:
@@ -216,34 +473,106 @@ class Notepad:
             self.text.config(wrap='none')
             self.h_scroll.pack(side='bottom', fill='x')
 
+    def _update_font_metrics(self):
+        # For monospaced fonts (the Consolas default) every glyph shares
+        # one advance width, so a single measure() at font-change time is
+        # enough; cache it and derive the tab stops from it rather than
+        # measuring characters again later.
+        self._mono_w = self.text_font.measure('M')
+        self._is_mono = all(self.text_font.measure(c) == self._mono_w for c in 'iWlm.')
+        if self._is_mono:
+            self.text.configure(tabs=(self._mono_w * 4,))
+        else:
+            self.text.configure(tabs='')
+
     def choose_font(self):
-        FontDialog(self.root, self)
+        if self._font_dlg is None:
+            self._font_dlg = FontDialog(self.root, self)
+        else:
+            self._font_dlg.deiconify()
 
     def show_about(self):
         messagebox.showinfo('About', 'Simple Notepad in Python\nBuilt with Tkinter')
 
     # Status updates
+    def _on_edit(self, event=None):
+        # Fired by the undo manager for every insert/delete. The serial
+        # lets caches keyed on buffer content (Find's match positions)
+        # invalidate reliably.
+        self._line_count = None
+        self.edit_serial += 1
+        # <<Modified>> only fires on the clean-to-dirty transition now,
+        # so this is the per-edit hook that keeps Ln/Col fresh for
+        # menu-driven Paste/Cut and undo/redo replays. Skipped during
+        # loads so the progress text isn't clobbered.
+        if not self._loading:
+            self._schedule_status()
+
     def _on_modified(self, event=None):
-        # reset modified flag (to catch future edits)
-        self.text.edit_modified(False)
+        # Track dirtiness in Python; resetting Tk's flag here would
+        # re-fire <<Modified>> on every edit. The flag is cleared only
+        # when the buffer transitions back to clean (new/open/save).
+        if not self.text.edit_modified():
+            # Re-fire from _mark_clean's edit_modified(False); ignoring
+            # it keeps a fresh save from looking dirty again.
+            return
+        if not self._dirty:
+            self._dirty = True
+            self._update_title()
+        self._schedule_status()
+
+    def _schedule_status(self):
+        # Coalesce bursts of keystrokes into one status refresh; a paste
+        # or fast typing otherwise redraws the label per key event.
+        if self._status_pending:
+            return
+        self._status_pending = True
+        self.root.after(30, self._do_status)
+
+    def _do_status(self):
+        self._status_pending = False
         self._update_status()
 
+    def _on_map(self, event=None):
+        # Catch up on refreshes skipped while minimized/withdrawn.
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self._update_status()
+            self._update_title()
+
     def _update_status(self):
-        row, col = self.text.index('insert').split('.')
+        if not self.root.winfo_viewable():
+            self._pending_refresh = True
+            return
+        row, _, col = self.text.index('insert').partition('.')
+        col = int(col) + 1
         mode = 'WRAP' if self.wrap_var.get() else 'NOWRAP'
         name = os.path.basename(self.filename) if self.filename else 'Untitled'
-        self.status.set(f'{name}    Ln {row}, Col {int(col)+1}    {mode}')
+        state = (row, col, name, mode)
+        if state == self._last_status:
+            # Nothing changed; skip the StringVar set and label redraw.
+            return
+        self._last_status = state
+        self.status.set(f'{name}    Ln {row}, Col {col}    {mode}')
 
     def _update_title(self):
+        if not self.root.winfo_viewable():
+            self._pending_refresh = True
+            return
         name = os.path.basename(self.filename) if self.filename else 'Untitled'
-        changed = '*' if self.text.edit_modified() else ''
+        changed = '*' if self._dirty else ''
         self.root.title(f'{name}{changed} - Notepad')
 
 
 class FindDialog(tk.Toplevel):
-    def __init__(self, parent, text_widget):
+    def __init__(self, parent, notepad):
         super().__init__(parent)
-        self.text_widget = text_widget
+        self.notepad = notepad
+        self.text_widget = notepad.text
+        self._match_positions = None
+        self._match_key = None
+        self._lower_key = None
+        self._lower_buf = ''
         self.title('Find')
         self.transient(parent)
         self.resizable(False, False)
@@ -258,24 +587,80 @@ class FindDialog(tk.Toplevel):
 
         btn_frame = tk.Frame(self)
         tk.Button(btn_frame, text='Find Next', command=self.find_next).pack(side='left', padx=2)
-        tk.Button(btn_frame, text='Cancel', command=self.destroy).pack(side='left')
+        tk.Button(btn_frame, text='Cancel', command=self.withdraw).pack(side='left')
         btn_frame.grid(row=2, column=1, sticky='e', pady=2)
 
-        self.protocol('WM_DELETE_WINDOW', self.destroy)
+        self.protocol('WM_DELETE_WINDOW', self.withdraw)
+
+    def _lowered(self, buf):
+        # Cache the lowercased buffer so short case-insensitive needles
+        # don't re-lower the whole document on each new search. Keyed on
+        # the app's edit serial, which ticks on every insert/delete.
+        key = self.notepad.edit_serial
+        if self._lower_key != key:
+            self._lower_key = key
+            self._lower_buf = buf.lower()
+        return self._lower_buf
+
+    def _positions(self, buf, needle):
+        # One pass collects every match position; repeated Find Next
+        # clicks then just bisect into the list until the needle, case
+        # option, or buffer changes (tracked via the app's edit serial).
+        key = (needle, self.match_case.get(), self.notepad.edit_serial)
+        if key != self._match_key:
+            self._match_key = key
+            match_case = self.match_case.get()
+            src = pat = None
+            if match_case:
+                src, pat = buf, needle
+            elif len(needle) <= 3:
+                lowered = self._lowered(buf)
+                folded = needle.lower()
+                # str.lower() can change length ('İ' lowers to two code
+                # points), shifting every offset mapped back into the
+                # original buffer; the fast path is only safe when both
+                # lengths survive the fold.
+                if len(lowered) == len(buf) and len(folded) == len(needle):
+                    src, pat = lowered, folded
+            if src is not None:
+                # str.find runs the same two-way search as the regex
+                # engine but skips compilation and match-object
+                # bookkeeping — a clear win for the common short-needle
+                # case.
+                positions = []
+                pos = src.find(pat)
+                while pos >= 0:
+                    positions.append(pos)
+                    pos = src.find(pat, pos + len(pat))
+                self._match_positions = positions
+            else:
+                self._match_positions = [
+                    m.start()
+                    for m in re.finditer(re.escape(needle), buf, re.IGNORECASE)
+                ]
+        return self._match_positions
 
     def find_next(self):
+        # Searching a half-loaded buffer gives bogus results; wait for
+        # the idle loader to finish.
+        if self.notepad._loading:
+            return
         needle = self.find_entry.get()
         if not needle:
             return
-        start = self.text_widget.index('insert')
-        if self.match_case.get():
-            idx = self.text_widget.search(needle, start, stopindex='end')
-        else:
-            idx = self.text_widget.search(needle, start, nocase=1, stopindex='end')
-        if not idx:
+        # Search the buffer in Python instead of Tk's naive per-character
+        # scanner, then map the flat offset back to a line.col index.
+        buf = self.text_widget.get('1.0', 'end-1c')
+        counted = self.text_widget.count('1.0', 'insert', 'chars')
+        off = counted[0] if counted else 0
+        positions = self._positions(buf, needle)
+        i = bisect.bisect_left(positions, off)
+        if i >= len(positions):
             messagebox.showinfo('Find', 'No more matches found')
             return
-        end = f"{idx}+{len(needle)}c"
+        pos = positions[i]
+        idx = self.text_widget.index(f'1.0 + {pos} chars')
+        end = self.text_widget.index(f'1.0 + {pos + len(needle)} chars')
         self.text_widget.tag_remove('find_highlight', '1.0', 'end')
         self.text_widget.tag_add('find_highlight', idx, end)
         self.text_widget.tag_config('find_highlight', underline=True)
@@ -284,9 +669,12 @@ class FindDialog(tk.Toplevel):
 
 
 class ReplaceDialog(tk.Toplevel):
-    def __init__(self, parent, text_widget):
+    def __init__(self, parent, notepad):
         super().__init__(parent)
-        self.text_widget = text_widget
+        self.notepad = notepad
+        self.text_widget = notepad.text
+        self._pat = None
+        self._pat_key = None
         self.title('Replace')
         self.transient(parent)
         self.resizable(False, False)
@@ -305,53 +693,78 @@ class ReplaceDialog(tk.Toplevel):
         btn_frame = tk.Frame(self)
         tk.Button(btn_frame, text='Replace', command=self.replace_one).pack(side='left', padx=2)
         tk.Button(btn_frame, text='Replace All', command=self.replace_all).pack(side='left', padx=2)
-        tk.Button(btn_frame, text='Cancel', command=self.destroy).pack(side='left')
+        tk.Button(btn_frame, text='Cancel', command=self.withdraw).pack(side='left')
         btn_frame.grid(row=3, column=1, sticky='e', pady=2)
 
-        self.protocol('WM_DELETE_WINDOW', self.destroy)
+        self.protocol('WM_DELETE_WINDOW', self.withdraw)
+
+    def _pattern(self, needle):
+        # Recompile only when the needle or case option changes; the
+        # compiled pattern is reused across Replace clicks.
+        key = (needle, self.match_case.get())
+        if key != self._pat_key:
+            self._pat_key = key
+            flags = 0 if self.match_case.get() else re.IGNORECASE
+            self._pat = re.compile(re.escape(needle), flags)
+        return self._pat
 
     def replace_one(self):
+        # The widget is disabled between load slices, so edits would be
+        # silently dropped; don't pretend they happened.
+        if self.notepad._loading:
+            return
         needle = self.find_entry.get()
         repl = self.replace_entry.get()
         if not needle:
             return
-        start = self.text_widget.index('insert')
-        if self.match_case.get():
-            idx = self.text_widget.search(needle, start, stopindex='end')
-        else:
-            idx = self.text_widget.search(needle, start, nocase=1, stopindex='end')
-        if not idx:
+        # Match in Python on the buffer rather than via Tk's nocase
+        # search, which lowercases candidates character by character.
+        buf = self.text_widget.get('1.0', 'end-1c')
+        counted = self.text_widget.count('1.0', 'insert', 'chars')
+        off = counted[0] if counted else 0
+        m = self._pattern(needle).search(buf, off)
+        if not m:
             messagebox.showinfo('Replace', 'No matches found')
             return
-        end = f"{idx}+{len(needle)}c"
-        self.text_widget.delete(idx, end)
+        # Resolve the match start once; derive the end and the new insert
+        # position relative to it so Tk only walks the B-tree from '1.0'
+        # a single time per replace.
+        idx = self.text_widget.index(f'1.0 + {m.start()} chars')
+        self.text_widget.delete(idx, f'{idx}+{m.end() - m.start()}c')
         self.text_widget.insert(idx, repl)
         self.text_widget.mark_set('insert', f'{idx}+{len(repl)}c')
         self.text_widget.see('insert')
 
     def replace_all(self):
+        if self.notepad._loading:
+            return
         needle = self.find_entry.get()
         repl = self.replace_entry.get()
         if not needle:
             return
-        count = 0
-        idx = '1.0'
-        while True:
-            if self.match_case.get():
-                idx = self.text_widget.search(needle, idx, stopindex='end')
-            else:
-                idx = self.text_widget.search(needle, idx, nocase=1, stopindex='end')
-            if not idx:
-                break
-            end = f"{idx}+{len(needle)}c"
-            self.text_widget.delete(idx, end)
-            self.text_widget.insert(idx, repl)
-            idx = f"{idx}+{len(repl)}c"
-            count += 1
+        # Do the replacement on a single Python string instead of looping
+        # text.search/delete/insert per match: one Tcl crossing each way
+        # rather than two per occurrence.
+        src = self.text_widget.get('1.0', 'end-1c')
+        if self.match_case.get():
+            count = src.count(needle)
+            out = src.replace(needle, repl)
+        else:
+            # Replacement via a callable so backslashes in repl stay literal.
+            out, count = self._pattern(needle).subn(lambda m: repl, src)
+        if count:
+            ins = self.text_widget.index('insert')
+            self.text_widget.delete('1.0', 'end')
+            self.text_widget.insert('1.0', out)
+            self.text_widget.mark_set('insert', ins)
         messagebox.showinfo('Replace All', f'Replaced {count} occurrence(s)')
 
 
 class FontDialog(tk.Toplevel):
+    # Sorted font families, enumerated from Tk once per session; listing
+    # every installed font is an expensive Tcl call.
+    _families_cache = None
+
     def __init__(self, parent, notepad):
         super().__init__(parent)
         self.notepad = notepad
@@ -359,16 +772,18 @@ class FontDialog(tk.Toplevel):
         self.transient(parent)
         self.resizable(False, False)
 
-        tk.Label(self, text='Family:').grid(row=0, column=0, sticky='e')
-        families = list(font.families())
-        families.sort()
-        self.family_var = tk.StringVar(value=self.notepad.current_font_family)
-        self.family_box = tk.Listbox(self, listvariable=tk.StringVar(value=families), height=10)
-        if self.notepad.current_font_family in families:
-            idx = families.index(self.notepad.current_font_family)
-            self.family_box.select_set(idx)
-            self.family_box.see(idx)
-        self.family_box.grid(row=0, column=1, padx=4, pady=4)
+        tk.Label(self, text='Family:').grid(row=0, column=0, sticky='ne')
+        if FontDialog._families_cache is None:
+            FontDialog._families_cache = tuple(sorted(font.families()))
+        fam_frame = tk.Frame(self)
+        self.filter_var = tk.StringVar()
+        self.filter_entry = tk.Entry(fam_frame, width=30, textvariable=self.filter_var)
+        self.filter_entry.pack(fill='x')
+        self.family_box = tk.Listbox(fam_frame, height=10)
+        self.family_box.pack(fill='x')
+        fam_frame.grid(row=0, column=1, padx=4, pady=4)
+        self.filter_var.trace_add('write', self._refilter)
+        self._refilter()
 
         tk.Label(self, text='Size:').grid(row=1, column=0, sticky='e')
         sizes = [8,9,10,11,12,14,16,18,20,24,28,32]
@@ -384,9 +799,25 @@ class FontDialog(tk.Toplevel):
 
         btn_frame = tk.Frame(self)
         tk.Button(btn_frame, text='OK', command=self.apply).pack(side='left', padx=2)
-        tk.Button(btn_frame, text='Cancel', command=self.destroy).pack(side='left')
+        tk.Button(btn_frame, text='Cancel', command=self.withdraw).pack(side='left')
         btn_frame.grid(row=2, column=1, sticky='e', pady=4)
 
+        self.protocol('WM_DELETE_WINDOW', self.withdraw)
+
+    def _refilter(self, *args):
+        # Only materialize the first 100 matching families; copying the
+        # full system list into the Listbox is the expensive part.
+        pfx = self.filter_var.get().lower()
+        matches = [f for f in FontDialog._families_cache if f.lower().startswith(pfx)][:100]
+        self.family_box.delete(0, 'end')
+        if matches:
+            self.family_box.insert('end', *matches)
+        current = self.notepad.current_font_family
+        if current in matches:
+            idx = matches.index(current)
+            self.family_box.select_set(idx)
+            self.family_box.see(idx)
+
     def apply(self):
         try:
             sel = self.family_box.curselection()
@@ -399,9 +830,10 @@ class FontDialog(tk.Toplevel):
                 self.notepad.current_font_size = size
             self.notepad.text_font.config(family=self.notepad.current_font_family, size=self.notepad.current_font_size)
             self.notepad.text.configure(font=self.notepad.text_font)
+            self.notepad._update_font_metrics()
         except Exception:
             pass
-        self.destroy()
+        self.withdraw()
 
 
 if __name__ == '__main__':